@@ -1,16 +1,17 @@
-import asyncio
-import copy
 import inspect
-import json
 import uuid
-from typing import Optional
+from datetime import datetime
+from itertools import chain
+from typing import Any, Optional
 from uuid import UUID
 
+import orjson
 from dependency_injector import containers, providers
 from dependency_injector.containers import Container
 from dependency_injector.providers import Dependency, Factory, Provider, Singleton
 from dependency_injector.wiring import Provide, inject  # noqa
 from lato import Application, DependencyProvider, TransactionContext
+from lato.exceptions import UnknownDependencyError
 from pydantic_settings import BaseSettings
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
@@ -35,29 +36,44 @@ from ..modules.operation.infrastructure.operation_postgres_repository import (
 )
 
 from src.seedwork.application.inbox_outbox import InMemoryOutbox
-from src.seedwork.infrastructure.logging import Logger, logger
+from src.seedwork.domain.repositories import EVENT_COLLECTING_TYPES
+from src.seedwork.infrastructure.clock import TRANSACTION_NOW
+from src.seedwork.infrastructure.logging import Logger, logger, next_correlation_id
 
 
-def _default(val):
-    import uuid
-    import datetime
+def _slot_names(cls: type) -> list[str]:
+    return [
+        name
+        for klass in cls.__mro__
+        for name in vars(klass).get("__slots__", ())
+        if name != "__weakref__"
+    ]
 
-    if isinstance(val, datetime.datetime):
-        return val.isoformat()
-    if hasattr(val, "__dict__"):
-        return val.__dict__
+
+def _default(val):
+    # orjson only handles exact uuid.UUID, not subclasses such as GenericUUID
     if isinstance(val, uuid.UUID):
         return str(val)
+    if hasattr(val, "__dict__"):
+        return val.__dict__
+    slot_names = _slot_names(type(val))
+    if slot_names:
+        return {name: getattr(val, name) for name in slot_names}
     raise TypeError()
 
 
-def dumps(d):
-    return json.dumps(d, default=_default)
+def dumps(d) -> str:
+    # orjson handles datetime, exact UUID, enums and dataclasses natively; enum
+    # keys (e.g. fee policies by achievement type) need OPT_NON_STR_KEYS
+    return orjson.dumps(d, default=_default, option=orjson.OPT_NON_STR_KEYS).decode()
 
 
 def create_db_engine(config):
     engine = create_engine(
-        config.DATABASE_URL, echo=config.DATABASE_ECHO, json_serializer=dumps
+        config.DATABASE_URL,
+        echo=config.DATABASE_ECHO,
+        json_serializer=dumps,
+        json_deserializer=orjson.loads,
     )
     from src.seedwork.infrastructure.database import Base
 
@@ -83,9 +99,8 @@ def create_application(db_engine) -> Application:
     def on_create_transaction_context(**kwargs):
         engine = application.get_dependency("db_engine")
         session = Session(engine)
-        correlation_id = uuid.uuid4()
-        logger.correlation_id.set(uuid.uuid4())  # type: ignore
-        strategy_repository=StrategyPostgresJsonManagementRepository(db_session=session)
+        correlation_id = next_correlation_id()
+        logger.correlation_id.set(correlation_id)  # type: ignore
 
         # create IoC container for the transaction
         dependency_provider = ContainerProvider(
@@ -93,7 +108,6 @@ def create_application(db_engine) -> Application:
                 db_session=session,
                 correlation_id=correlation_id, 
                 logger=logger,
-                strategy_repository=strategy_repository
             )
         )
 
@@ -102,6 +116,7 @@ def create_application(db_engine) -> Application:
     @application.on_enter_transaction_context
     def on_enter_transaction_context(ctx: TransactionContext):
         ctx.set_dependencies(publish=ctx.publish)
+        ctx.set_dependency("transaction_now_token", TRANSACTION_NOW.set(datetime.now()))
         logger.debug("Entering transaction")
 
     @application.on_exit_transaction_context
@@ -109,17 +124,21 @@ def create_application(db_engine) -> Application:
         ctx: TransactionContext, exception: Optional[Exception] = None
     ):
         session = ctx["db_session"]
-        if exception:
-            session.rollback()
-            logger.warning(f"rollback due to {exception}")
+        try:
+            if exception:
+                session.rollback()
+                logger.warning(f"rollback due to {exception}")
 
-            # from pydantic import ValidationError
-            # if type(exception) not in [ValidationError]:
-            #     raise exception
-        else:
-            session.commit()
-            logger.debug(f"committed")
-        session.close()
+                # from pydantic import ValidationError
+                # if type(exception) not in [ValidationError]:
+                #     raise exception
+            else:
+                session.commit()
+                logger.debug(f"committed")
+            session.close()
+        finally:
+            # restores the clock of an outer transaction, if any, even when the commit fails
+            TRANSACTION_NOW.reset(ctx["transaction_now_token"])
         logger.debug(f"transaction ended")
         logger.correlation_id.set(uuid.UUID(int=0))  # type: ignore
 
@@ -131,9 +150,7 @@ def create_application(db_engine) -> Application:
             else ""
         )
         logger.debug(f"Executing {description}...")
-        result = call_next()
-        if asyncio.iscoroutine(result):
-            result = await result
+        result = await call_next()
         logger.debug(f"Finished executing {description}")
         return result
 
@@ -141,18 +158,19 @@ def create_application(db_engine) -> Application:
     async def event_collector_middleware(ctx: TransactionContext, call_next):
         handler_kwargs = call_next.keywords
 
-        result = call_next()
-        if asyncio.iscoroutine(result):
-            result = await result
+        result = await call_next()
 
         logger.debug(f"Collecting event from {ctx['message'].__class__}")
 
-        domain_events = []
-        repositories = filter(
-            lambda x: hasattr(x, "collect_events"), handler_kwargs.values()
+        repositories = (
+            x for x in handler_kwargs.values() if type(x) in EVENT_COLLECTING_TYPES
         )
-        for repo in repositories:
-            domain_events.extend(repo.collect_events())
+        # drained before publishing: handlers may add entities to the same repositories
+        domain_events = list(
+            chain.from_iterable(repo.collect_events() for repo in repositories)
+        )
+
+        # published one at a time: handlers share the transaction session and ctx state
         for event in domain_events:
             logger.debug(f"Publishing {event}")
             await ctx.publish_async(event)
@@ -176,6 +194,8 @@ class ApplicationContainer(containers.DeclarativeContainer):
 class TransactionContainer(containers.DeclarativeContainer):
     """Dependency Injection container for the transaction context (transaction-level dependencies)
     Most of the dependencies are singletons, as each transaction receives new transaction container.
+    Plain `Singleton` (not `ThreadSafeSingleton`) is used on purpose: a transaction container is
+    consumed by a single task, so it needs no lock around instance creation.
     """
 
     correlation_id = providers.Dependency(instance_of=UUID)
@@ -194,9 +214,10 @@ class TransactionContainer(containers.DeclarativeContainer):
         db_session=db_session,
     )
 
-    partner_fees_provider = PartnerFeesProvider(
-        repository=partner_repository, # type: ignore
-        evaluator=PartnerEvaluator()
+    partner_fees_provider = providers.Singleton(
+        PartnerFeesProvider,
+        repository=partner_repository,
+        evaluator=providers.Singleton(PartnerEvaluator),
     )
 
     operation_repository = providers.Singleton(
@@ -204,64 +225,97 @@ class TransactionContainer(containers.DeclarativeContainer):
         db_session=db_session,
     )
 
-def resolve_provider_by_type(container: Container, cls: type) -> Optional[Provider]:
-    def inspect_provider(provider: Provider) -> bool:
-        if isinstance(provider, (Factory, Singleton)):
-            return issubclass(provider.cls, cls)
-        elif isinstance(provider, Dependency):
-            return issubclass(provider.instance_of, cls)
-
-        return False
-
-    matching_providers = inspect.getmembers(
-        container,
-        inspect_provider,
-    )
-    if matching_providers:
-        if len(matching_providers) > 1:
-            raise ValueError(
-                f"Cannot uniquely resolve {cls}. Found {len(providers)} matching resources."
-            )
-        return matching_providers[0][1]
-    return None
+def provided_type(provider: Provider) -> Optional[type]:
+    if isinstance(provider, (Factory, Singleton)):
+        cls = provider.cls
+    elif isinstance(provider, Dependency):
+        cls = provider.instance_of
+    else:
+        return None
+    # providers backed by a function (e.g. create_db_engine) are not indexed by type
+    return cls if isinstance(cls, type) else None
+
+
+def build_type_index(container: Container) -> dict[type, list[Provider]]:
+    """Maps every class in the MRO of a provided type to the providers supplying it"""
+    type_index: dict[type, list[Provider]] = {}
+    for provider in container.providers.values():
+        cls = provided_type(provider)
+        if cls is None:
+            continue
+        for base in inspect.getmro(cls):
+            type_index.setdefault(base, []).append(provider)
+    return type_index
+
+
+def shallow_copy_container(container: Container) -> Container:
+    """Same result as copy.copy(container), minus the generic __reduce_ex__ round trip"""
+    cls = container.__class__
+    clone = cls.__new__(cls)
+    clone.__dict__.update(container.__dict__)
+    return clone
 
 
 class ContainerProvider(DependencyProvider):
     """A dependency provider that uses a dependency injector container under the hood"""
 
-    def __init__(self, container: Container):
-        self.container = container
-        self.counter = 0
+    def __init__(
+        self,
+        container: Container,
+        type_index: Optional[dict[type, list[Provider]]] = None,
+    ) -> None:
+        self.container: Container = container
+        self.counter: int = 0
+        self._type_index: dict[type, list[Provider]] = (
+            build_type_index(container) if type_index is None else type_index
+        )
+
+    def resolve_provider_by_type(self, cls: type) -> Optional[Provider]:
+        matching_providers = self._type_index.get(cls)
+        if matching_providers:
+            if len(matching_providers) > 1:
+                raise ValueError(
+                    f"Cannot uniquely resolve {cls}. Found {len(matching_providers)} matching resources."
+                )
+            return matching_providers[0]
+        return None
 
     def has_dependency(self, identifier: str | type) -> bool:
-        if isinstance(identifier, type) and resolve_provider_by_type(
-            self.container, identifier
-        ):
+        if isinstance(identifier, type) and self.resolve_provider_by_type(identifier):
             return True
         if type(identifier) is str:
             return identifier in self.container.providers
         return False
 
-    def register_dependency(self, identifier, dependency_instance):
+    def register_dependency(self, identifier: str | type, dependency_instance: Any) -> None:
         pr = providers.Object(dependency_instance)
-        try:
-            setattr(self.container, identifier, pr)
-        except TypeError:
+        if not isinstance(identifier, str):
             setattr(self.container, f"{str(identifier)}-{self.counter}", pr)
             self.counter += 1
-
-    def get_dependency(self, identifier):
-        try:
-            if isinstance(identifier, type):
-                provider = resolve_provider_by_type(self.container, identifier)
-            else:
-                provider = getattr(self.container, identifier)
-            instance = provider()
-        except Exception as e:
-            raise e
-        return instance
-
-    def copy(self, *args, **kwargs):
-        dp = ContainerProvider(copy.copy(self.container))
+            return
+
+        replaced = self.container.providers.get(identifier)
+        setattr(self.container, identifier, pr)
+        # object providers are not indexed by type, so the index only
+        # goes stale when a typed provider gets replaced
+        if replaced is not None and provided_type(replaced) is not None:
+            self._type_index = build_type_index(self.container)
+
+    def get_dependency(self, identifier: str | type) -> Any:
+        provider: Optional[Provider]
+        if isinstance(identifier, type):
+            provider = self.resolve_provider_by_type(identifier)
+        else:
+            provider = getattr(self.container, identifier)
+        if provider is None:
+            raise UnknownDependencyError(identifier)
+        return provider()
+
+    def copy(self, *args: Any, **kwargs: Any) -> "ContainerProvider":
+        # a shallow copy is the cheapest clone the container offers; rebinding
+        # providers on a fresh container measured several times slower
+        dp = ContainerProvider(
+            shallow_copy_container(self.container), self._type_index.copy()
+        )
         dp.update(*args, **kwargs)
         return dp
@@ -0,0 +1,206 @@
+import asyncio
+from dataclasses import dataclass
+
+import orjson
+import pytest
+from dependency_injector import containers, providers
+from lato.exceptions import UnknownDependencyError
+from sqlalchemy import create_engine
+
+from src.config import container as container_module
+from src.config.container import ContainerProvider, create_application, dumps
+from src.seedwork.application.commands import Command
+from src.seedwork.domain.entities import AggregateRoot
+from src.seedwork.domain.events import DomainEvent
+from src.seedwork.domain.value_objects import GenericUUID, Money
+from src.seedwork.infrastructure.clock import TRANSACTION_NOW
+from src.seedwork.infrastructure.repository import InMemoryRepository
+
+
+class Repository:
+    pass
+
+
+class PartnerRepository(Repository):
+    pass
+
+
+class StrategyRepository(Repository):
+    pass
+
+
+def create_container() -> containers.DynamicContainer:
+    container = containers.DynamicContainer()
+    container.partner_repository = providers.Singleton(PartnerRepository)
+    container.strategy_repository = providers.Singleton(StrategyRepository)
+    return container
+
+
+@pytest.fixture
+def index_builds(monkeypatch):
+    builds = []
+    build_type_index = container_module.build_type_index
+
+    def counting_build_type_index(container):
+        builds.append(container)
+        return build_type_index(container)
+
+    monkeypatch.setattr(container_module, "build_type_index", counting_build_type_index)
+    return builds
+
+
+@pytest.mark.unit
+def test_container_provider_resolves_by_type_and_base_type():
+    dp = ContainerProvider(create_container())
+
+    assert dp.has_dependency(PartnerRepository)
+    assert dp.get_dependency(PartnerRepository) is dp.get_dependency("partner_repository")
+    assert not dp.has_dependency(int)
+
+
+@pytest.mark.unit
+def test_container_provider_skips_callable_backed_providers():
+    container = create_container()
+    container.engine = providers.Singleton(lambda: PartnerRepository())
+
+    dp = ContainerProvider(container)
+
+    assert isinstance(dp.get_dependency("engine"), PartnerRepository)
+    assert dp.get_dependency(PartnerRepository) is dp.get_dependency("partner_repository")
+
+
+@pytest.mark.unit
+def test_container_provider_raises_on_unknown_type():
+    dp = ContainerProvider(create_container())
+
+    with pytest.raises(UnknownDependencyError):
+        dp.get_dependency(int)
+
+
+@pytest.mark.unit
+def test_container_provider_raises_on_ambiguous_type():
+    dp = ContainerProvider(create_container())
+
+    with pytest.raises(ValueError):
+        dp.get_dependency(Repository)
+
+
+@pytest.mark.unit
+def test_registering_object_dependencies_keeps_the_index(index_builds):
+    dp = ContainerProvider(create_container())
+
+    for _ in range(5):
+        dp.update(ctx=object())
+        dp.register_dependency("message", object())
+
+    assert len(index_builds) == 1
+    assert isinstance(dp.get_dependency(StrategyRepository), StrategyRepository)
+
+
+@pytest.mark.unit
+def test_replacing_a_typed_provider_rebuilds_the_index(index_builds):
+    dp = ContainerProvider(create_container())
+    strategy_repository = StrategyRepository()
+
+    dp.register_dependency("strategy_repository", strategy_repository)
+
+    assert len(index_builds) == 2
+    assert not dp.has_dependency(StrategyRepository)
+    assert dp.get_dependency("strategy_repository") is strategy_repository
+
+
+@pytest.mark.unit
+def test_copy_shares_the_index(index_builds):
+    dp = ContainerProvider(create_container())
+
+    copied = dp.copy(message=object())
+
+    assert len(index_builds) == 1
+    assert copied.get_dependency(PartnerRepository) is dp.get_dependency(PartnerRepository)
+
+
+class SlottedValueObject:
+    __slots__ = ("amount",)
+
+    def __init__(self, amount: float) -> None:
+        self.amount = amount
+
+
+@pytest.mark.unit
+def test_dumps_serializes_uuid_subclasses_and_value_objects():
+    uuid = GenericUUID.next_id()
+
+    assert orjson.loads(dumps({"id": uuid})) == {"id": str(uuid)}
+    assert orjson.loads(dumps({"price": Money(amount=5)})) == {
+        "price": {"amount": 5, "currency": "ARS"}
+    }
+    assert orjson.loads(dumps({"value": SlottedValueObject(amount=5)})) == {
+        "value": {"amount": 5}
+    }
+
+
+@dataclass(kw_only=True)
+class Listing(AggregateRoot[GenericUUID]):
+    pass
+
+
+class PublishListing(Command):
+    listing_id: GenericUUID
+
+
+class ListingPublished(DomainEvent):
+    listing_id: GenericUUID
+
+
+@pytest.mark.unit
+def test_event_handlers_can_add_to_the_repository_being_collected():
+    application = create_application(create_engine("sqlite://"))
+    repository = InMemoryRepository()
+    listing = Listing(id=Listing.next_id())
+    repository.add(listing)
+    added = []
+
+    @application.handler(PublishListing)
+    async def publish_listing(command: PublishListing, repository: InMemoryRepository):
+        repository.get_by_id(command.listing_id).register_event(
+            ListingPublished(listing_id=command.listing_id)
+        )
+
+    @application.handler(ListingPublished)
+    def add_related_listing(event: ListingPublished, repository: InMemoryRepository):
+        related = Listing(id=Listing.next_id())
+        repository.add(related)
+        added.append(related)
+
+    async def execute():
+        async with application.transaction_context() as ctx:
+            ctx.set_dependency("repository", repository)
+            await ctx.execute_async(PublishListing(listing_id=listing.id))
+
+    asyncio.run(execute())
+
+    assert len(added) == 1
+    assert repository.count() == 2
+
+
+class FailingCommit(Command):
+    pass
+
+
+@pytest.mark.unit
+def test_failed_commit_restores_the_clock():
+    application = create_application(create_engine("sqlite://"))
+
+    @application.handler(FailingCommit)
+    def failing_commit(command: FailingCommit, db_session):
+        def commit():
+            raise RuntimeError("connection lost")
+
+        db_session.commit = commit
+
+    async def execute():
+        with pytest.raises(RuntimeError):
+            await application.execute_async(FailingCommit())
+        return TRANSACTION_NOW.get()
+
+    assert asyncio.run(execute()) is None
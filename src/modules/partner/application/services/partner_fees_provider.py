@@ -5,6 +5,8 @@ from ...domain.exceptions import PartnerException
 from ....shared_kernel import PartnershipStatus
 from ....shared_kernel import AchievementType, OperationType
 
+_BLOCKED_STATUSES = frozenset({PartnershipStatus.INACTIVE, PartnershipStatus.BANNED})
+
 class PartnerFeesProvider:
     def __init__(self, repository: PartnerRepository, evaluator: PartnerEvaluator):
         self.repository = repository
@@ -14,8 +16,7 @@ class PartnerFeesProvider:
                      operation_type: OperationType) -> float:
         partner = self.repository.get_by_id(partner_id)
         
-        if partner.status in [PartnershipStatus.INACTIVE, PartnershipStatus.BANNED]:
+        if partner.status in _BLOCKED_STATUSES:
             raise PartnerException.without_permissions(status=partner.status)
         
-        fee_policy = self.evaluator.get_fee_policies(partner.tier)[achievement_type]
-        return fee_policy.fees[operation_type]
\ No newline at end of file
+        return self.evaluator.get_fee(partner.tier, achievement_type, operation_type)
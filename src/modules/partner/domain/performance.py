@@ -2,51 +2,72 @@ from __future__ import annotations
 from datetime import datetime
 from dataclasses import dataclass, field
 from typing import Dict
+import msgspec
 from src.seedwork.domain.value_objects import Money, Currency
+from src.seedwork.infrastructure.clock import now
 from ...shared_kernel import Period
 
+class RevenueModel(msgspec.Struct):
+    amount: float
+    currency: Currency
+
+class PartnerPerformanceModel(msgspec.Struct):
+    """Typed layout of a serialized PartnerPerformance, validated by msgspec"""
+    period: str
+    operations_closed: int
+    properties_captured: int
+    revenue_generated: RevenueModel
+    last_updated: datetime
+
 @dataclass
 class PartnerPerformance:
     period: Period
     operations_closed: int = 0
     properties_captured: int = 0
     revenue_generated: Money = field(default_factory=lambda: Money(amount=0))
-    last_updated: datetime = field(default_factory=datetime.now)
+    last_updated: datetime = field(default_factory=now)
+
+    def _substract_revenue(self, amount: Money) -> None:
+        # checked here once, so the new total is built without re-validating it
+        revenue = self.revenue_generated
+        revenue_amount = revenue.amount - amount.amount
+        assert revenue_amount >= 0, "Amount must be greather than 0"
+        self.revenue_generated = Money._unchecked(revenue_amount, revenue.currency)
 
     def register_close(self, amount: Money) -> None:
         self.operations_closed += 1
         self.revenue_generated += amount
-        self.last_updated = datetime.now()
+        self.last_updated = now()
 
     def register_capture(self, amount: Money) -> None:
         self.properties_captured += 1
         self.revenue_generated += amount
-        self.last_updated = datetime.now()
+        self.last_updated = now()
 
     def remove_close(self, amount: Money) -> None:
         assert self.operations_closed > 0, "There is no closed achievement to remove"
 
         self.operations_closed -= 1
-        self.revenue_generated -= amount
-        self.last_updated = datetime.now()
+        self._substract_revenue(amount)
+        self.last_updated = now()
 
     def remove_capture(self, amount: Money) -> None:
         assert self.properties_captured > 0, "There is no capture achievement to remove"
 
         self.properties_captured -= 1
-        self.revenue_generated -= amount
-        self.last_updated = datetime.now()
+        self._substract_revenue(amount)
+        self.last_updated = now()
 
     def add_revenue_generated(self, amount: Money) -> None:
         self.revenue_generated += amount
-        self.last_updated = datetime.now()
+        self.last_updated = now()
 
     def substract_revenue_generated(self, amount: Money) -> None:
         assert self.revenue_generated > amount, "Amount to substract must be greather " \
         "than revenue generated"
 
-        self.revenue_generated -= amount
-        self.last_updated = datetime.now()
+        self._substract_revenue(amount)
+        self.last_updated = now()
 
     def as_dict(self) -> Dict:
         return {
@@ -62,13 +83,14 @@ class PartnerPerformance:
 
     @classmethod
     def from_dict(cls, perfomance_data: Dict[str, str]) -> PartnerPerformance:
+        model = msgspec.convert(perfomance_data, PartnerPerformanceModel)
         return cls(
-            period=Period.from_str_format(perfomance_data["period"]),
-            operations_closed=int(perfomance_data["operations_closed"]),
-            properties_captured=int(perfomance_data["properties_captured"]),
+            period=Period.from_str_format(model.period),
+            operations_closed=model.operations_closed,
+            properties_captured=model.properties_captured,
             revenue_generated=Money(
-                amount=float(perfomance_data["revenue_generated"]["amount"]), #type: ignore
-                currency=Currency(perfomance_data["revenue_generated"]["currency"]) #type: ignore
+                amount=model.revenue_generated.amount,
+                currency=model.revenue_generated.currency
             ),
-            last_updated=datetime.fromisoformat((perfomance_data["last_updated"])) #type: ignore
-        )
\ No newline at end of file
+            last_updated=model.last_updated
+        )
@@ -1,15 +1,17 @@
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from .entities import PartnerPerformance, Partner
 from .value_objects import FeePolicy
 from .enums import PartnerTier
 from .default_policies import POLICIES
-from ...shared_kernel import AchievementType, Period
+from ...shared_kernel import AchievementType, OperationType, Period
 from src.seedwork.domain.value_objects import Money
 from src.seedwork.domain.services import DomainService
 
 class PartnerEvaluator(DomainService):
     def __init__(self, fee_policies: Dict[PartnerTier, Dict[AchievementType, FeePolicy]]=POLICIES) -> None:
         self.policies = fee_policies
+        # fees resolved from the policies, cached for the lifetime of the evaluator
+        self._fees: Dict[Tuple[PartnerTier, AchievementType, OperationType], float] = {}
 
     def determine_tier(self, performance: PartnerPerformance) -> PartnerTier:
         if performance.revenue_generated.amount > 25_000:
@@ -21,6 +23,15 @@ class PartnerEvaluator(DomainService):
 
     def get_fee_policies(self, tier: PartnerTier) -> Dict[AchievementType, FeePolicy]:
         return self.policies[tier]
+
+    def get_fee(self, tier: PartnerTier, achievement_type: AchievementType,
+                operation_type: OperationType) -> float:
+        key = (tier, achievement_type, operation_type)
+        try:
+            return self._fees[key]
+        except KeyError:
+            fee = self._fees[key] = self.policies[tier][achievement_type].fees[operation_type]
+            return fee
         
 class PartnerAchievementRegistrator(DomainService):
     def __init__(self, partner: Partner) -> None:
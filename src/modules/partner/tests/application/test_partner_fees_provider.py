@@ -0,0 +1,70 @@
+import pytest
+
+from src.modules.partner.application.services.partner_fees_provider import PartnerFeesProvider
+from src.modules.partner.domain.entities import Partner
+from src.modules.partner.domain.enums import PartnerTier
+from src.modules.partner.domain.exceptions import PartnerException
+from src.modules.partner.domain.service import PartnerEvaluator
+from src.modules.shared_kernel import AchievementType, OperationType, PartnershipStatus
+from src.seedwork.domain.value_objects import GenericUUID
+
+
+class PartnerRepositoryStub:
+    def __init__(self, partner: Partner) -> None:
+        self.partner = partner
+
+    def get_by_id(self, entity_id: GenericUUID) -> Partner:
+        return self.partner
+
+
+def create_partner(status: PartnershipStatus, tier: PartnerTier = PartnerTier.JUNIOR) -> Partner:
+    return Partner(
+        id=Partner.next_id(),
+        user_id=GenericUUID.next_id(),
+        name="Juan Perez",
+        tier=tier,
+        status=status,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("status", [PartnershipStatus.INACTIVE, PartnershipStatus.BANNED])
+def test_get_fee_for_blocked_partner_raises_exception(status):
+    partner = create_partner(status=status)
+    provider = PartnerFeesProvider(
+        repository=PartnerRepositoryStub(partner), evaluator=PartnerEvaluator()  # type: ignore
+    )
+
+    with pytest.raises(PartnerException):
+        provider.get_fee_for(partner.id, AchievementType.CLOSE, OperationType.SELL)
+
+
+@pytest.mark.unit
+def test_get_fee_for_active_partner_uses_tier_policies():
+    partner = create_partner(status=PartnershipStatus.ACTIVE, tier=PartnerTier.SENIOR)
+    evaluator = PartnerEvaluator()
+    provider = PartnerFeesProvider(
+        repository=PartnerRepositoryStub(partner), evaluator=evaluator  # type: ignore
+    )
+
+    assert provider.get_fee_for(partner.id, AchievementType.CLOSE, OperationType.SELL) == 12
+    assert provider.get_fee_for(partner.id, AchievementType.CLOSE, OperationType.SELL) == 12
+    assert provider.get_fee_for(partner.id, AchievementType.CAPTURE, OperationType.RENT) == 13
+
+
+@pytest.mark.unit
+def test_evaluator_caches_resolved_fees_per_instance():
+    policies = {
+        PartnerTier.JUNIOR: {
+            AchievementType.CLOSE: PartnerEvaluator().get_fee_policies(PartnerTier.JUNIOR)[AchievementType.CLOSE]
+        }
+    }
+    evaluator = PartnerEvaluator(fee_policies=policies)  # type: ignore
+
+    assert evaluator.get_fee(PartnerTier.JUNIOR, AchievementType.CLOSE, OperationType.RENT) == 20
+    policies[PartnerTier.JUNIOR] = {}
+    assert evaluator.get_fee(PartnerTier.JUNIOR, AchievementType.CLOSE, OperationType.RENT) == 20
+    with pytest.raises(KeyError):
+        PartnerEvaluator(fee_policies=policies).get_fee(  # type: ignore
+            PartnerTier.JUNIOR, AchievementType.CLOSE, OperationType.RENT
+        )
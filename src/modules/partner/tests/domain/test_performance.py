@@ -0,0 +1,59 @@
+import dataclasses
+
+import orjson
+import pytest
+
+from src.modules.partner.domain.performance import PartnerPerformance
+from src.modules.shared_kernel import Period
+from src.seedwork.domain.value_objects import Currency, Money
+
+
+def create_performance() -> PartnerPerformance:
+    return PartnerPerformance(period=Period(year=2025, month=3))
+
+
+@pytest.mark.unit
+def test_register_and_remove_achievements_update_revenue():
+    performance = create_performance()
+
+    performance.register_close(Money(amount=100))
+    performance.register_capture(Money(amount=50))
+    performance.remove_close(Money(amount=100))
+
+    assert performance.operations_closed == 0
+    assert performance.properties_captured == 1
+    assert performance.revenue_generated == Money(amount=50)
+
+
+@pytest.mark.unit
+def test_remove_more_than_revenue_generated_fails():
+    performance = create_performance()
+    performance.register_capture(Money(amount=10))
+
+    with pytest.raises(AssertionError):
+        performance.remove_capture(Money(amount=20))
+
+
+@pytest.mark.unit
+def test_as_dict_from_dict_round_trip():
+    performance = create_performance()
+    performance.register_close(Money(amount=100, currency=Currency.USD))
+
+    stored = orjson.loads(orjson.dumps(performance.as_dict()))
+
+    assert PartnerPerformance.from_dict(stored) == performance
+
+
+@pytest.mark.unit
+def test_revenue_generated_is_a_dataclass_field():
+    performance = create_performance()
+    performance.register_close(Money(amount=100))
+
+    assert orjson.loads(orjson.dumps(performance))["revenue_generated"] == {
+        "amount": 100, "currency": "ARS"
+    }
+    assert dataclasses.asdict(performance)["revenue_generated"] == {
+        "amount": 100, "currency": Currency.ARS
+    }
+    assert dataclasses.replace(performance).revenue_generated == Money(amount=100)
+    assert "revenue_generated=Money(amount=100" in repr(performance)
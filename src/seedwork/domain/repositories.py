@@ -1,16 +1,24 @@
 import abc
-from typing import Generic, TypeVar
+from typing import Generic, Iterator, TypeVar
 
 from src.seedwork.domain.entities import Entity as DomainEntity
+from src.seedwork.domain.events import DomainEvent
 from src.seedwork.domain.value_objects import GenericUUID
 
 Entity = TypeVar("Entity", bound=DomainEntity)
 EntityId = TypeVar("EntityId", bound=GenericUUID)
 
+# Repository types exposing collect_events, registered as they are defined
+EVENT_COLLECTING_TYPES: set[type] = set()
+
 
 class GenericRepository(Generic[EntityId, Entity], metaclass=abc.ABCMeta):
     """An interface for a generic repository"""
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        EVENT_COLLECTING_TYPES.add(cls)
+
     @abc.abstractmethod
     def add(self, entity: Entity) -> None:
         raise NotImplementedError()
@@ -32,7 +40,7 @@ class GenericRepository(Generic[EntityId, Entity], metaclass=abc.ABCMeta):
         raise NotImplementedError()
 
     @abc.abstractmethod
-    def collect_events(self):
+    def collect_events(self) -> Iterator[DomainEvent]:
         raise NotImplementedError()
 
     def __getitem__(self, index) -> Entity:
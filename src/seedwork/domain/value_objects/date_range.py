@@ -4,8 +4,9 @@ from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from .value_objects import ValueObject
 from .period import Period
+from ...infrastructure.clock import now
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DateRange(ValueObject):
     start: datetime
     end: datetime
@@ -15,28 +16,31 @@ class DateRange(ValueObject):
 
     @property
     def year_month_start_format(self) -> str:
-        return self.start.strftime("%Y-%m")
+        return f"{self.start.year:04d}-{self.start.month:02d}"
 
     @property
     def already_started(self) -> bool:
-        return self.start < datetime.now()
+        # inclusive, so a range started "now" inside a transaction (frozen clock) counts as started
+        return self.start <= now()
     
     @property
     def finished(self) -> bool:
-        return datetime.now() > self.end
+        # the end is exclusive, so a range stopped "now" counts as finished
+        return now() >= self.end
 
     @property
     def on_going(self) -> bool:
-        return self.already_started and not self.finished
+        _now = now()
+        return self.start <= _now < self.end
 
     @property
     def days_to_start(self) -> int:
-        _days_to_start = (self.start - datetime.now()).days
+        _days_to_start = (self.start - now()).days
         return _days_to_start if _days_to_start else 0
 
     @property
     def days_left(self) -> int:
-        return self.relative_date_days_left(datetime.now())
+        return self.relative_date_days_left(now())
 
     @property
     def period_range_days(self) -> int:
@@ -44,7 +48,7 @@ class DateRange(ValueObject):
 
     @staticmethod
     def create_range_starting_now(end: datetime) -> DateRange:
-        return DateRange(datetime.now(), end)
+        return DateRange(now(), end)
 
     @staticmethod
     def add_period_to_datetime(_from: datetime, **period: float) -> datetime:
@@ -55,15 +59,15 @@ class DateRange(ValueObject):
 
     @staticmethod
     def from_now_to(**period: float) -> DateRange:
-        end_period_datetime = DateRange.add_period_to_datetime(_from=datetime.now(), **period)
+        end_period_datetime = DateRange.add_period_to_datetime(_from=now(), **period)
         return DateRange.create_range_starting_now(end_period_datetime)
 
     @staticmethod
     def current_period() -> DateRange:
-        now = datetime.now()
-        start_date = datetime(now.year, now.month, 1)
-        last_day = calendar.monthrange(now.year, now.month)[1]
-        end_date = datetime(now.year, now.month, last_day, 23, 59, 59, 999999)
+        today = now()
+        start_date = datetime(today.year, today.month, 1)
+        last_day = calendar.monthrange(today.year, today.month)[1]
+        end_date = datetime(today.year, today.month, last_day, 23, 59, 59, 999999)
 
         return DateRange(start=start_date, end=end_date)
 
@@ -71,7 +75,8 @@ class DateRange(ValueObject):
         return DateRange(date, self.end).period_range_days if not self.finished else 0
 
     def stopped(self) -> DateRange:
-        return replace(self, end=datetime.now())
+        # a range started in the current transaction still has to end after its start
+        return replace(self, end=max(now(), self.start + timedelta(microseconds=1)))
 
     def extended(self, **period: float) -> DateRange:
         new_end = DateRange.add_period_to_datetime(_from=self.end, **period)
@@ -8,10 +8,12 @@ class Currency(str, Enum):
     USD = "USD"
     ARS = "ARS"
 
-@dataclass(frozen=True, kw_only=True)
+DEFAULT_CURRENCY = Currency.ARS
+
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Money(ValueObject):
     amount: float
-    currency: Currency = Currency.ARS
+    currency: Currency = DEFAULT_CURRENCY
 
     def __repr__(self) -> str:
         return f"Money(amount={round(self.amount, 2)} currency={str(self.currency.value)})"
@@ -19,6 +21,14 @@ class Money(ValueObject):
     def __post_init__(self):
         assert self.amount >= 0, "Amount must be greather than 0"
 
+    @classmethod
+    def _unchecked(cls, amount: float, currency: Currency) -> Money:
+        """Builds a Money whose amount is known to be valid, skipping __post_init__"""
+        money = object.__new__(cls)
+        object.__setattr__(money, "amount", amount)
+        object.__setattr__(money, "currency", currency)
+        return money
+
     def __lt__(self, other: Money) -> bool:
         return self.amount < other.amount
 
@@ -32,14 +42,16 @@ class Money(ValueObject):
         return Money(amount=self.amount * other, currency=self.currency)
 
     def __add__(self, other: Money) -> Money:
-        return Money(amount=self.amount + other.amount, currency=self.currency)
+        # both operands are non-negative, so the sum is too
+        return Money._unchecked(self.amount + other.amount, self.currency)
 
     def __sub__(self, other: Money) -> Money:
         return Money(amount=self.amount - other.amount, currency=self.currency)
 
     def calculate_fee(self, fee: Fee) -> Money:        
+        # Fee values are validated to be positive
         amount = (self.amount * fee.value) / 100
-        return Money(amount=amount, currency=self.currency)
+        return Money._unchecked(amount, self.currency)
     
     def convert(self, to_currency: Currency, price: float) -> Money:
         return Money(amount=self.amount / price, currency=to_currency)
@@ -1,38 +1,52 @@
 from __future__ import annotations
 from typing import Optional
-from datetime import datetime
 from dataclasses import dataclass
+from functools import lru_cache
+from ...infrastructure.clock import now
 
 @dataclass(frozen=True)
 class Period:
+    # _repr caches representation() without being a dataclass field
+    __slots__ = ("year", "month", "_repr")
+
     year: int
     month: int
 
     def __post_init__(self):
         assert 1 <= self.month <= 12, "Month must be between 1 and 12"
-        assert self.year <= 2025, "Year must be 2025 or earlier"
+        assert self.year <= now().year, "Year must not be in the future"
+        object.__setattr__(self, "_repr", f"{self.month:02d}-{self.year}")
+
+    def __reduce__(self):
+        # frozen slots can't be restored through setattr, so rebuild via __init__
+        return self.__class__, (self.year, self.month)
 
     def __lt__(self, period: Period) -> bool:
-        return self.year < period.year or self.month < period.month
+        return (self.year, self.month) < (period.year, period.month)
 
     def __gt__(self, period: Period) -> bool:
-        return self.year > period.year or self.month > period.month
+        return (self.year, self.month) > (period.year, period.month)
 
     def representation(self) -> str:
-        return f"{self.month:02d}-{self.year}"
+        return self._repr
 
     def inside_range_period(self, start: Period, end: Period) -> bool:
         return start < self and self < end  
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def from_str_format(cls, period: str) -> Period:
+        # "MM-YYYY", as produced by representation(), is sliced without splitting
+        if len(period) == 7 and period[2] == "-":
+            return cls(year=int(period[3:]), month=int(period[:2]))
+        # other forms, e.g. an unpadded "3-2025", are still accepted
         month_str, year_str = period.split("-")
         return cls(year=int(year_str), month=int(month_str))
 
     @classmethod
     def get_current_period(cls) -> Period:
-        now = datetime.now()
+        today = now()
         return cls(
-            year=now.year,
-            month=now.month
-        )
\ No newline at end of file
+            year=today.year,
+            month=today.month
+        )
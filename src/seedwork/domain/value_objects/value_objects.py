@@ -20,4 +20,6 @@ class GenericUUID(uuid.UUID):
 class ValueObject:
     """
     Base class for value objects
-    """
\ No newline at end of file
+    """
+
+    __slots__ = ()
\ No newline at end of file
@@ -0,0 +1,12 @@
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Optional
+
+TRANSACTION_NOW: ContextVar[Optional[datetime]] = ContextVar(
+    "transaction_now", default=None
+)
+
+
+def now() -> datetime:
+    """Returns the time frozen for the current transaction, or the wall clock outside of one"""
+    return TRANSACTION_NOW.get() or datetime.now()
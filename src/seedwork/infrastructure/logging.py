@@ -1,4 +1,7 @@
 import logging
+import os
+import random
+import threading
 import uuid
 from contextvars import ContextVar
 from datetime import datetime
@@ -13,6 +16,20 @@ correlation_id: ContextVar[uuid.UUID] = ContextVar(
     "correlation_id", default=uuid.UUID("00000000-0000-0000-0000-000000000000")
 )
 
+_correlation_id_rng = threading.local()
+os.register_at_fork(after_in_child=lambda: _correlation_id_rng.__dict__.clear())
+
+
+def next_correlation_id() -> uuid.UUID:
+    """
+    Returns a random UUID for log correlation without reading os.urandom on every call.
+    Not cryptographically secure, do not use it for tokens or entity ids.
+    """
+    rng = getattr(_correlation_id_rng, "rng", None)
+    if rng is None:
+        rng = _correlation_id_rng.rng = random.Random(os.urandom(16))
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
 
 class RequestContextFilter(logging.Filter):
     """ "Provides correlation id parameter for the logger"""
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Iterator
 
 from sqlalchemy.orm import Session
 
@@ -43,11 +43,9 @@ class InMemoryRepository(GenericRepository[GenericUUID, Entity]):
     def persist_all(self):
         ...
 
-    def collect_events(self) -> list[DomainEvent]:
-        events = []
+    def collect_events(self) -> Iterator[DomainEvent]:
         for entity in self.objects.values():
-            events.extend(entity.collect_events())
-        return events
+            yield from entity.collect_events()
 
 
 # a sentinel value for keeping track of entities removed from the repository
@@ -114,13 +112,11 @@ class SqlAlchemyGenericRepository(GenericRepository[GenericUUID, Entity]):
             if entity is not REMOVED:
                 self.persist(entity)
 
-    def collect_events(self):
+    def collect_events(self) -> Iterator[DomainEvent]:
         """Collects all events from entities known to the repository (present in the identity map)."""
-        events = []
         for entity in self._identity_map.values():
             if entity is not REMOVED:
-                events.extend(entity.collect_events())
-        return events
+                yield from entity.collect_events()
 
     @property
     def data_mapper(self):
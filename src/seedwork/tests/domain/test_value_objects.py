@@ -1,7 +1,12 @@
+import pickle
+from dataclasses import FrozenInstanceError, asdict, astuple
+from datetime import datetime, timedelta
+
 import pytest
 from pydantic import BaseModel
 
-from src.seedwork.domain.value_objects import GenericUUID, Money
+from src.seedwork.infrastructure.clock import TRANSACTION_NOW
+from src.seedwork.domain.value_objects import Currency, DateRange, GenericUUID, Money, Period
 
 
 class CustomPydanticModel(BaseModel):
@@ -10,9 +15,144 @@ class CustomPydanticModel(BaseModel):
 
 @pytest.mark.unit
 def test_money_equality():
-    assert Money(10, "USD") == Money(10, "USD")
+    assert Money(amount=10, currency=Currency.USD) == Money(amount=10, currency=Currency.USD)
 
 
 @pytest.mark.unit
 def test_money_ordering():
-    assert Money(10, "USD") < Money(100, "USD")
+    assert Money(amount=10, currency=Currency.USD) < Money(amount=100, currency=Currency.USD)
+
+
+@pytest.mark.unit
+def test_period_ordering():
+    assert Period(year=2024, month=12) < Period(year=2025, month=1)
+    assert not Period(year=2025, month=1) < Period(year=2024, month=12)
+    assert Period(year=2025, month=1) > Period(year=2024, month=12)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "period, expected",
+    [
+        ("03-2025", Period(year=2025, month=3)),
+        ("12-2024", Period(year=2024, month=12)),
+        ("3-2025", Period(year=2025, month=3)),
+    ],
+)
+def test_period_from_str_format(period, expected):
+    assert Period.from_str_format(period) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("period", ["", "2025", "03/2025", "ab-2025", "03-2025-01"])
+def test_period_from_str_format_rejects_malformed_input(period):
+    with pytest.raises(ValueError):
+        Period.from_str_format(period)
+
+
+@pytest.mark.unit
+def test_period_from_str_format_caches_parsed_periods():
+    Period.from_str_format.cache_clear()
+
+    first = Period.from_str_format("05-2024")
+    second = Period.from_str_format("05-2024")
+
+    assert first is second
+    assert Period.from_str_format.cache_info().hits == 1
+
+
+@pytest.mark.unit
+def test_period_shape_excludes_cached_representation():
+    period = Period(year=2025, month=3)
+
+    assert period.representation() == "03-2025"
+    assert asdict(period) == {"year": 2025, "month": 3}
+    assert astuple(period) == (2025, 3)
+    assert pickle.loads(pickle.dumps(period)).representation() == "03-2025"
+
+
+@pytest.mark.unit
+def test_period_year_ceiling_follows_the_transaction_clock():
+    token = TRANSACTION_NOW.set(datetime(2024, 6, 1))
+    try:
+        assert Period.get_current_period() == Period(year=2024, month=6)
+        with pytest.raises(AssertionError):
+            Period(year=2025, month=1)
+    finally:
+        TRANSACTION_NOW.reset(token)
+
+
+@pytest.mark.unit
+def test_money_is_frozen():
+    money = Money(amount=10)
+    with pytest.raises(FrozenInstanceError):
+        money.amount = 20  # type: ignore
+
+
+@pytest.mark.unit
+def test_money_hash_follows_equality():
+    assert hash(Money(amount=10)) == hash(Money(amount=10))
+    assert Money(amount=10, currency=Currency.USD) != Money(amount=10)
+
+
+@pytest.mark.unit
+def test_money_pickling():
+    money = Money(amount=10, currency=Currency.USD)
+    assert pickle.loads(pickle.dumps(money)) == money
+
+
+@pytest.mark.unit
+def test_money_arithmetic_keeps_amount_non_negative():
+    assert Money(amount=10) + Money(amount=5) == Money(amount=15)
+    with pytest.raises(AssertionError):
+        Money(amount=10) * -1
+    with pytest.raises(AssertionError):
+        Money(amount=5) - Money(amount=10)
+
+
+class CustomPydanticModelWithMoney(BaseModel):
+    revenue: Money
+
+
+@pytest.mark.unit
+def test_money_pydantic_round_trip():
+    model = CustomPydanticModelWithMoney(revenue={"amount": 5})  # type: ignore
+    assert model.revenue == Money(amount=5)
+    assert model.model_dump() == {"revenue": {"amount": 5.0, "currency": Currency.ARS}}
+
+    dumped = model.model_dump_json()
+    assert dumped == '{"revenue":{"amount":5.0,"currency":"ARS"}}'
+    assert CustomPydanticModelWithMoney.model_validate_json(dumped) == model
+
+
+@pytest.mark.unit
+def test_date_range_started_now_is_on_going_within_a_transaction():
+    token = TRANSACTION_NOW.set(datetime.now())
+    try:
+        period = DateRange.from_now_to(days=1)
+        assert period.already_started
+        assert period.on_going
+    finally:
+        TRANSACTION_NOW.reset(token)
+
+
+@pytest.mark.unit
+def test_stopped_date_range_is_finished_within_a_transaction():
+    token = TRANSACTION_NOW.set(datetime.now())
+    try:
+        period = DateRange(datetime.now() - timedelta(days=1), datetime.now() + timedelta(days=1))
+        stopped = period.stopped()
+        assert stopped.finished
+        assert not stopped.on_going
+    finally:
+        TRANSACTION_NOW.reset(token)
+
+
+@pytest.mark.unit
+def test_date_range_started_now_can_be_stopped_within_a_transaction():
+    token = TRANSACTION_NOW.set(datetime.now())
+    try:
+        stopped = DateRange.from_now_to(days=1).stopped()
+        assert stopped.start < stopped.end
+    finally:
+        TRANSACTION_NOW.reset(token)